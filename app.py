@@ -1,3 +1,5 @@
+import os
+
 from flask import Flask, request, jsonify
 from flasgger import Swagger
 from dotenv import load_dotenv
@@ -9,7 +11,10 @@ load_dotenv()
 app = Flask(__name__)
 swagger = Swagger(app)
 
-vote_service = VoteService(credentials_path="cred/ganache_output.txt")
+vote_service = VoteService(
+    credentials_path="cred/ganache_output.txt",
+    allowlist_path=os.getenv("VOTER_ALLOWLIST"),
+)
 
 
 @app.route("/vote", methods=["POST"])
@@ -41,13 +46,83 @@ def vote():
               type: string
             receipt:
               type: string
+      400:
+        description: Service account is not on the voter allowlist
     """
     data = request.get_json()
     candidate_address = data["candidate_address"]
-    receipt = vote_service.vote(candidate_address)
+    try:
+        receipt = vote_service.vote(candidate_address)
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
     return jsonify({"status": "success", "receipt": str(receipt)})
 
 
+@app.route("/results/history", methods=["GET"])
+def get_results_history():
+    """
+    Get per-block vote history and turnout
+    ---
+    tags:
+      - Voting
+    parameters:
+      - name: from_block
+        in: query
+        type: integer
+        required: false
+        description: First block of the range (default 0)
+      - name: to_block
+        in: query
+        type: integer
+        required: false
+        description: Last block of the range (default and cap latest synced block)
+      - name: points
+        in: query
+        type: integer
+        required: false
+        description: Maximum sampled blocks in the range (default 100, max 10000)
+      - name: electorate
+        in: query
+        type: integer
+        required: false
+        description: Eligible voters for turnout (default allowlist size)
+    responses:
+      200:
+        description: Cumulative counts, votes per window and turnout per sampled block
+        schema:
+          type: object
+          properties:
+            candidates:
+              type: array
+              items:
+                type: string
+            blocks:
+              type: array
+              items:
+                type: integer
+            cumulative:
+              type: object
+            votes:
+              type: object
+            turnout:
+              type: array
+              items:
+                type: number
+      400:
+        description: Invalid block range or electorate
+    """
+    try:
+        history = vote_service.get_history(
+            from_block=request.args.get("from_block", 0, type=int),
+            to_block=request.args.get("to_block", None, type=int),
+            points=request.args.get("points", 100, type=int),
+            electorate=request.args.get("electorate", None, type=int),
+        )
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+    return jsonify(history.model_dump())
+
+
 @app.route("/results/<candidate_address>", methods=["GET"])
 def get_results(candidate_address):
     """
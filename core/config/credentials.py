@@ -2,13 +2,84 @@ import subprocess
 import time
 import re
 import os
-from typing import List, Optional, IO
-from pydantic import BaseModel
+import mmap
+import struct
+from collections.abc import Sequence
+from typing import Iterator, Optional, IO
+from eth_utils import to_checksum_address
 
+# Cache layout: header (magic, count, source output size and mtime_ns), then
+# `count` 20-byte accounts, then `count` 32-byte private keys, both in
+# Ganache's index order.
+CACHE_MAGIC = b"GCREDS02"
+CACHE_HEADER = struct.Struct("<8sQQq")
+ADDRESS_SIZE = 20
+KEY_SIZE = 32
+POLL_SECONDS = 0.1
 
-class GanacheCredentials(BaseModel):
-    accounts: List[str]
-    private_keys: List[str]
+ACCOUNT_LINE = re.compile(r"^\(\d+\)\s*0x([a-fA-F0-9]{40})\b")
+PRIVKEY_LINE = re.compile(r"^\(\d+\)\s*0x([a-fA-F0-9]{64})\b")
+
+
+class _CacheColumn(Sequence):
+    def __init__(self, cache: "CredentialCache", getter):
+        self._cache = cache
+        self._getter = getter
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._getter(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("credential index out of range")
+        return self._getter(index)
+
+
+class CredentialCache:
+    """
+    Read-only view over a credentials cache file. Accounts and keys are
+    decoded on demand, so loading one key costs one slice of the mmap.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._data = None
+        try:
+            # mmap rejects empty files (ValueError); short headers raise struct.error
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self._count, self.source_size, self.source_mtime_ns = (
+                CACHE_HEADER.unpack_from(self._data, 0)
+            )
+            if magic != CACHE_MAGIC:
+                raise ValueError(f"Not a credentials cache file: {path}")
+        except BaseException:
+            self.close()
+            raise
+        self._accounts_offset = CACHE_HEADER.size
+        self._keys_offset = self._accounts_offset + self._count * ADDRESS_SIZE
+        self.accounts = _CacheColumn(self, self.account)
+        self.private_keys = _CacheColumn(self, self.private_key)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def account(self, index: int) -> str:
+        at = self._accounts_offset + index * ADDRESS_SIZE
+        return to_checksum_address(self._data[at : at + ADDRESS_SIZE])
+
+    def private_key(self, index: int) -> str:
+        at = self._keys_offset + index * KEY_SIZE
+        return "0x" + self._data[at : at + KEY_SIZE].hex()
+
+    def close(self):
+        if self._data is not None:
+            self._data.close()
+        self._file.close()
 
 
 class GanacheManager:
@@ -17,13 +88,15 @@ class GanacheManager:
         num_accounts: int = 10,
         output_file: str = "output.txt",
         wait_seconds: int = 5,
+        cache_file: Optional[str] = None,
     ):
         self.num_accounts = num_accounts
         self.output_file = output_file
         self.wait_seconds = wait_seconds
+        self.cache_file = cache_file or os.path.splitext(output_file)[0] + ".creds"
         self.process: Optional[subprocess.Popen] = None
         self.output_handle: Optional[IO] = None
-        self.credentials: Optional[GanacheCredentials] = None
+        self.credentials: Optional[CredentialCache] = None
 
     def start_ganache(self):
         """
@@ -38,39 +111,157 @@ class GanacheManager:
         )
         print("Ganache process started.")
 
-    def extract_credentials(self) -> GanacheCredentials:
+    def _follow_output(self) -> Iterator[str]:
         """
-        Waits, extracts credentials, and deletes output file.
-        Note: Does not terminate the process automatically anymore.
+        Yields output lines as Ganache writes them, for up to `wait_seconds`
+        without new complete lines.
         """
-        print(f"Waiting {self.wait_seconds} seconds for Ganache output...")
-        time.sleep(self.wait_seconds)
+        deadline = time.monotonic() + self.wait_seconds
+        with open(self.output_file, "r") as f:
+            pending = ""
+            while True:
+                line = f.readline()
+                if line:
+                    pending += line
+                    if pending.endswith("\n"):
+                        yield pending
+                        pending = ""
+                        deadline = time.monotonic() + self.wait_seconds
+                    continue
+                if time.monotonic() >= deadline:
+                    if pending:
+                        yield pending
+                    return
+                time.sleep(POLL_SECONDS)
 
-        if self.output_handle:
-            self.output_handle.close()
+    def _write_cache(self):
+        """
+        Single pass over the output: accounts are written to the cache as they
+        are read, keys follow once the account count is known.
+        Stops reading at the last private key.
+        """
+        section = None
+        accounts = keys = 0
+        tmp_path = self.cache_file + ".tmp"
+        try:
+            with open(tmp_path, "wb") as cache:
+                cache.write(CACHE_HEADER.pack(CACHE_MAGIC, 0, 0, 0))
+                for line in self._follow_output():
+                    stripped = line.strip()
+                    if stripped.startswith("Available Accounts"):
+                        section = "accounts"
+                        continue
+                    if stripped.startswith("Private Keys"):
+                        section = "keys"
+                        continue
+                    if section == "accounts":
+                        match = ACCOUNT_LINE.match(stripped)
+                        if match:
+                            cache.write(bytes.fromhex(match.group(1)))
+                            accounts += 1
+                    elif section == "keys":
+                        match = PRIVKEY_LINE.match(stripped)
+                        if match:
+                            cache.write(bytes.fromhex(match.group(1)))
+                            keys += 1
+                            if keys == accounts:
+                                break
 
-        with open(self.output_file, "r") as f:
-            content = f.read()
-        print(content)
+                if not accounts or keys != accounts:
+                    raise ValueError(
+                        "Could not extract accounts or private keys. "
+                        "Check Ganache output."
+                    )
+                source = os.stat(self.output_file)
+                cache.seek(0)
+                cache.write(
+                    CACHE_HEADER.pack(
+                        CACHE_MAGIC, accounts, source.st_size, source.st_mtime_ns
+                    )
+                )
+            os.replace(tmp_path, self.cache_file)
+        except BaseException:
+            # never leave partial private keys behind
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
-        account_pattern = re.compile(r"\(\d+\)\s*(0x[a-fA-F0-9]{40})\s*")
-        accounts = [acc.strip() for acc in account_pattern.findall(content)]
-        accounts.sort(key=lambda x: content.find(x))  # Sort by appearance in content
+    def _first_account(self) -> Optional[str]:
+        """
+        Returns the first account in the output file without waiting for more.
+        """
+        with open(self.output_file, "r") as f:
+            for line in f:
+                match = ACCOUNT_LINE.match(line.strip())
+                if match:
+                    return match.group(1).lower()
+        return None
 
-        privkey_pattern = re.compile(r"\(\d+\)\s(0x[a-fA-F0-9]{64})")
-        private_keys = privkey_pattern.findall(content)
-        private_keys.sort(
-            key=lambda x: content.find(x)
-        )  # Sort by appearance in content
+    def _cache_is_fresh(self) -> bool:
+        """
+        The cache is reused only if it was built from this exact output file:
+        same size and mtime_ns, and the same first account. A Ganache restart
+        within one timestamp tick still changes the accounts.
+        """
+        if self.process is not None or not os.path.exists(self.cache_file):
+            return False
+        if not os.path.exists(self.output_file):
+            # Nothing to compare against: the cache is pinned as-is.
+            # extract_credentials() checks it against the node when it can.
+            return True
+        try:
+            cache = CredentialCache(self.cache_file)
+        except (ValueError, struct.error):
+            return False
+        try:
+            source = os.stat(self.output_file)
+            if (cache.source_size, cache.source_mtime_ns) != (
+                source.st_size,
+                source.st_mtime_ns,
+            ):
+                return False
+            return len(cache) > 0 and (
+                cache.account(0).lower()[2:] == self._first_account()
+            )
+        finally:
+            cache.close()
 
-        if not accounts or not private_keys:
+    def _check_against_node(self, creds: CredentialCache, w3):
+        """
+        Fails if the node's first account is not the cached one, e.g. a
+        cache left over from an earlier Ganache run with another mnemonic.
+        Skipped when the node is unreachable.
+        """
+        if not w3.is_connected():
+            return
+        node_accounts = w3.eth.accounts
+        if node_accounts and node_accounts[0].lower() != creds.account(0).lower():
+            creds.close()
             raise ValueError(
-                "Could not extract accounts or private keys. Check Ganache output."
+                f"Credentials cache '{self.cache_file}' does not match the node "
+                f"(cached {creds.account(0)}, node {node_accounts[0]}). "
+                f"Regenerate '{self.output_file}' or delete the cache."
             )
 
-        creds = GanacheCredentials(accounts=accounts, private_keys=private_keys)
+    def extract_credentials(self, w3=None) -> CredentialCache:
+        """
+        Streams the Ganache output into the credentials cache and returns a lazy
+        view of it. Reuses an existing cache built from the same output file.
+        Without the output file the cache is reused as-is, so pass `w3` to
+        verify it against the running node.
+        Note: Does not terminate the process automatically anymore.
+        """
+        if self.output_handle:
+            self.output_handle.close()
+
+        if not self._cache_is_fresh():
+            print(f"Reading Ganache output from '{self.output_file}'...")
+            self._write_cache()
 
-        # self.delete_output_file()
+        creds = CredentialCache(self.cache_file)
+        if w3 is not None:
+            self._check_against_node(creds, w3)
+        print(f"Loaded {len(creds)} accounts from '{self.cache_file}'.")
 
         self.credentials = creds
         return creds
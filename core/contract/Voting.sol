@@ -19,6 +19,9 @@ contract Voting {
 
     address public owner;
     bool private initialized;
+    bytes32 public voterRoot;
+
+    event VoteCast(address indexed voter, address indexed candidate);
 
     constructor() {
         owner = msg.sender;
@@ -40,17 +43,35 @@ contract Voting {
         initialized = true;
     }
 
-    function vote(address candidateAddress) public {
+    // Registers the whole voter roll in one transaction; a zero root leaves voting open to any address.
+    function setVoterRoot(bytes32 _voterRoot) public onlyOwner {
+        voterRoot = _voterRoot;
+    }
+
+    function vote(address candidateAddress, bytes32[] calldata proof) public {
         require(!voters[msg.sender].hasVoted, "You have already voted.");
+        require(voterRoot == bytes32(0) || isEligible(msg.sender, proof), "Not on the voter allowlist.");
         require(bytes(candidates[candidateAddress].name).length > 0, "Invalid candidate.");
 
         voters[msg.sender].hasVoted = true;
         voters[msg.sender].votedFor = candidateAddress;
         candidates[candidateAddress].voteCount++;
+        emit VoteCast(msg.sender, candidateAddress);
     }
 
     function getCandidateVoteCount(address candidateAddress) public view returns (uint) {
         require(bytes(candidates[candidateAddress].name).length > 0, "Invalid candidate.");
         return candidates[candidateAddress].voteCount;
     }
+
+    function isEligible(address voter, bytes32[] calldata proof) public view returns (bool) {
+        bytes32 node = keccak256(abi.encodePacked(voter));
+        for (uint i = 0; i < proof.length; i++) {
+            bytes32 sibling = proof[i];
+            node = node < sibling
+                ? keccak256(abi.encodePacked(node, sibling))
+                : keccak256(abi.encodePacked(sibling, node));
+        }
+        return node == voterRoot;
+    }
 }
\ No newline at end of file
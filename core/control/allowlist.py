@@ -0,0 +1,302 @@
+import csv
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import numpy as np
+from Crypto.Hash import keccak as _keccak
+from pydantic import BaseModel
+
+# File layout:
+#   header    | magic, depth, count, capacity, root
+#   index     | `capacity` open-addressing slots of (roll position + 1) as uint32
+#   addresses | `count` raw 20-byte voter addresses in roll order
+#   levels    | every tree level from the leaves up to the root, bytes32 each
+# A voter's proof is one sibling per level, so the tree itself is the
+# compact form of all N proofs (~2N hashes instead of N * depth).
+MAGIC = b"VMERKLE1"
+HEADER = struct.Struct("<8sIQQ32s")
+SLOT = struct.Struct("<I")
+ADDRESS_SIZE = 20
+HASH_SIZE = 32
+CHUNK_NODES = 1 << 15
+COPY_BUFFER = 1 << 20
+
+
+def keccak(data: bytes) -> bytes:
+    # pycryptodome directly: eth_hash's backend dispatch costs ~20% per call,
+    # and the builder makes ~2N calls
+    return _keccak.new(data=data, digest_bytes=HASH_SIZE).digest()
+
+
+class AllowlistSummary(BaseModel):
+    root: str
+    count: int
+    depth: int
+    path: str
+
+
+def _leaf(address: bytes) -> bytes:
+    # Mirrors keccak256(abi.encodePacked(msg.sender)) in Voting.sol
+    return keccak(address)
+
+
+def _hash_pair(a: bytes, b: bytes) -> bytes:
+    # Sorted pairs, so proofs need no left/right flags
+    return keccak(a + b) if a < b else keccak(b + a)
+
+
+def _address_bytes(address: str) -> bytes:
+    value = address.strip()
+    if value[:2].lower() == "0x":
+        value = value[2:]
+    raw = bytes.fromhex(value)
+    if len(raw) != ADDRESS_SIZE:
+        raise ValueError(f"Invalid voter address: {address!r}")
+    return raw
+
+
+def _slot_for(leaf: bytes, capacity: int) -> int:
+    return int.from_bytes(leaf[:8], "little") & (capacity - 1)
+
+
+class MerkleAllowlistBuilder:
+    def __init__(self, roll_path: str, output_path: str, column: str = "address"):
+        self.roll_path = roll_path
+        self.output_path = str(Path(output_path).resolve())
+        self.column = column
+
+    def _iter_roll(self) -> Iterator[bytes]:
+        """
+        Streams voter addresses from the CSV roll, one row at a time.
+        Accepts either a header row containing `column` or a bare list of addresses.
+        """
+        with open(self.roll_path, "r", newline="") as f:
+            reader = csv.reader(f)
+            first = next(reader, None)
+            if first is None:
+                return
+            if self.column in first:
+                position = first.index(self.column)
+            else:
+                position = 0
+                yield _address_bytes(first[0])
+            for row in reader:
+                if row:
+                    yield _address_bytes(row[position])
+
+    def _build_level(self, src: str, dst: str) -> int:
+        """
+        Hashes one level of the tree into the next, reading fixed-size chunks.
+        An unpaired last node is promoted unchanged.
+        """
+        nodes = 0
+        with open(src, "rb") as fin, open(dst, "wb") as fout:
+            while True:
+                chunk = fin.read(CHUNK_NODES * HASH_SIZE)
+                if not chunk:
+                    break
+                out = bytearray()
+                for i in range(0, len(chunk) - HASH_SIZE, 2 * HASH_SIZE):
+                    out += _hash_pair(
+                        chunk[i : i + HASH_SIZE],
+                        chunk[i + HASH_SIZE : i + 2 * HASH_SIZE],
+                    )
+                if (len(chunk) // HASH_SIZE) % 2:
+                    out += chunk[-HASH_SIZE:]
+                fout.write(out)
+                nodes += len(out) // HASH_SIZE
+        return nodes
+
+    def build(self) -> AllowlistSummary:
+        """
+        Streams the roll into a Merkle tree and writes the indexed allowlist file.
+        Tree levels are spilled to temporary files so memory stays bounded
+        regardless of the roll size.
+        """
+        Path(self.output_path).parent.mkdir(parents=True, exist_ok=True)
+        level_paths = [f"{self.output_path}.level0"]
+        addresses_path = f"{self.output_path}.addresses"
+
+        try:
+            count = 0
+            with open(level_paths[0], "wb") as leaves, open(
+                addresses_path, "wb"
+            ) as addrs:
+                for address in self._iter_roll():
+                    leaves.write(_leaf(address))
+                    addrs.write(address)
+                    count += 1
+
+            if count == 0:
+                raise ValueError(f"No voter addresses found in {self.roll_path}")
+
+            nodes = count
+            while nodes > 1:
+                dst = f"{self.output_path}.level{len(level_paths)}"
+                nodes = self._build_level(level_paths[-1], dst)
+                level_paths.append(dst)
+
+            depth = len(level_paths) - 1
+            with open(level_paths[-1], "rb") as f:
+                root = f.read(HASH_SIZE)
+
+            capacity = 1
+            while capacity < 2 * count:
+                capacity <<= 1
+            index_offset = HEADER.size
+            addresses_offset = index_offset + capacity * SLOT.size
+
+            with open(self.output_path, "w+b") as out:
+                out.write(HEADER.pack(MAGIC, depth, count, capacity, root))
+                out.truncate(addresses_offset)
+                out.seek(addresses_offset)
+                for path in [addresses_path] + level_paths:
+                    with open(path, "rb") as src:
+                        while True:
+                            buf = src.read(COPY_BUFFER)
+                            if not buf:
+                                break
+                            out.write(buf)
+                out.flush()
+
+                data = mmap.mmap(out.fileno(), 0)
+                try:
+                    self._fill_index(data, count, capacity, addresses_offset)
+                    data.flush()
+                finally:
+                    data.close()
+        except BaseException:
+            if os.path.exists(self.output_path):
+                os.remove(self.output_path)
+            raise
+        finally:
+            for path in level_paths + [addresses_path]:
+                if os.path.exists(path):
+                    os.remove(path)
+
+        summary = AllowlistSummary(
+            root="0x" + root.hex(), count=count, depth=depth, path=self.output_path
+        )
+        print(f"✅ Merkle allowlist built: {count} voters, depth {depth}")
+        print(f"✅ Root: {summary.root}")
+        print(f"✅ Allowlist saved to {self.output_path}")
+        return summary
+
+    @staticmethod
+    def _fill_index(data: mmap.mmap, count: int, capacity: int, addresses_offset: int):
+        """
+        Fills the open-addressing index in vectorized rounds and rejects
+        duplicate addresses. Each round places, per free home slot, the first
+        pending voter that wants it; the rest probe one slot further. A voter
+        only moves past occupied slots, so lookups by linear probing find it.
+        """
+        mask = np.uint64(capacity - 1)
+        slots = np.frombuffer(data, dtype="<u4", count=capacity, offset=HEADER.size)
+        addresses = np.frombuffer(
+            data, dtype=f"V{ADDRESS_SIZE}", count=count, offset=addresses_offset
+        )
+        # First 8 bytes of every leaf, little-endian, as in _slot_for
+        leaf_keys = np.frombuffer(
+            data,
+            dtype="<u8",
+            count=count * (HASH_SIZE // 8),
+            offset=addresses_offset + count * ADDRESS_SIZE,
+        )[:: HASH_SIZE // 8]
+        try:
+            order = np.argsort(leaf_keys, kind="stable")
+            sorted_keys = leaf_keys[order]
+            for i in np.flatnonzero(sorted_keys[1:] == sorted_keys[:-1]):
+                first, second = order[i], order[i + 1]
+                if addresses[first] == addresses[second]:
+                    duplicate = addresses[second].tobytes().hex()
+                    raise ValueError(f"Duplicate voter address: 0x{duplicate}")
+
+            pending = np.arange(count, dtype=np.int64)
+            wanted = (leaf_keys & mask).astype(np.int64)
+            while pending.size:
+                free = np.flatnonzero(slots[wanted] == 0)
+                _, winners = np.unique(wanted[free], return_index=True)
+                placed = free[winners]
+                slots[wanted[placed]] = pending[placed] + 1
+                keep = np.ones(pending.size, dtype=bool)
+                keep[placed] = False
+                pending = pending[keep]
+                wanted = (wanted[keep] + 1) & (capacity - 1)
+        finally:
+            # release the exported buffers so the mmap can be closed
+            del slots, addresses, leaf_keys
+
+
+class MerkleAllowlist:
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.depth, self.count, self.capacity, self.root = HEADER.unpack_from(
+            self._data, 0
+        )
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a voter allowlist file: {path}")
+
+        self._index_offset = HEADER.size
+        self._addresses_offset = self._index_offset + self.capacity * SLOT.size
+        self._level_offsets = []
+        self._level_sizes = []
+        offset = self._addresses_offset + self.count * ADDRESS_SIZE
+        size = self.count
+        for _ in range(self.depth + 1):
+            self._level_offsets.append(offset)
+            self._level_sizes.append(size)
+            offset += size * HASH_SIZE
+            size = (size + 1) // 2
+
+    def index_of(self, address: str) -> Optional[int]:
+        """
+        Returns the roll position of `address`, or None if it is not on the allowlist.
+        """
+        raw = _address_bytes(address)
+        slot = _slot_for(_leaf(raw), self.capacity)
+        while True:
+            (stored,) = SLOT.unpack_from(
+                self._data, self._index_offset + slot * SLOT.size
+            )
+            if stored == 0:
+                return None
+            at = self._addresses_offset + (stored - 1) * ADDRESS_SIZE
+            if self._data[at : at + ADDRESS_SIZE] == raw:
+                return stored - 1
+            slot = (slot + 1) & (self.capacity - 1)
+
+    def proof_for(self, address: str) -> List[bytes]:
+        """
+        Returns the Merkle proof for `address` as a list of bytes32 values,
+        read as one sibling per tree level.
+        """
+        node = self.index_of(address)
+        if node is None:
+            raise KeyError(f"{address} is not on the voter allowlist")
+        proof = []
+        for offset, size in zip(self._level_offsets[:-1], self._level_sizes[:-1]):
+            sibling = node ^ 1
+            if sibling < size:
+                at = offset + sibling * HASH_SIZE
+                proof.append(self._data[at : at + HASH_SIZE])
+            node >>= 1
+        return proof
+
+    def verify(self, address: str, proof: List[bytes]) -> bool:
+        """
+        Off-chain equivalent of the contract's proof check.
+        """
+        node = _leaf(_address_bytes(address))
+        for sibling in proof:
+            node = _hash_pair(node, sibling)
+        return node == self.root
+
+    def close(self):
+        self._data.close()
+        self._file.close()
@@ -0,0 +1,219 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+MAX_HISTORY_POINTS = 10_000
+
+
+class HistoryCurve(BaseModel):
+    candidates: List[str]
+    blocks: List[int]
+    cumulative: Dict[str, List[int]]
+    votes: Dict[str, List[int]]
+    turnout: Optional[List[float]] = None
+
+
+class TallyHistory:
+    """
+    Columnar store of per-block tally deltas: (block, candidate id, delta).
+
+    Rows are kept in block order in growable NumPy columns so range queries
+    reduce to `searchsorted` + `bincount` over contiguous slices.
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        self._blocks = np.empty(initial_capacity, dtype=np.int64)
+        self._candidates = np.empty(initial_capacity, dtype=np.int32)
+        self._deltas = np.empty(initial_capacity, dtype=np.int32)
+        self._size = 0
+        self.candidate_ids: Dict[str, int] = {}
+        self.candidate_addresses: List[str] = []
+        self.synced_block = -1
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def blocks(self) -> np.ndarray:
+        return self._blocks[: self._size]
+
+    @property
+    def candidates(self) -> np.ndarray:
+        return self._candidates[: self._size]
+
+    @property
+    def deltas(self) -> np.ndarray:
+        return self._deltas[: self._size]
+
+    def candidate_id(self, address: str) -> int:
+        """
+        Returns the column id for `address`, assigning the next id on first sight.
+        """
+        if address not in self.candidate_ids:
+            self.candidate_ids[address] = len(self.candidate_addresses)
+            self.candidate_addresses.append(address)
+        return self.candidate_ids[address]
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        capacity = len(self._blocks)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_blocks", "_candidates", "_deltas"):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+
+    def extend(self, blocks, candidate_ids, deltas):
+        """
+        Appends a batch of deltas. The batch is aggregated per (block, candidate)
+        and must not start before the last stored block.
+        """
+        blocks = np.asarray(blocks, dtype=np.int64)
+        candidate_ids = np.asarray(candidate_ids, dtype=np.int32)
+        deltas = np.asarray(deltas, dtype=np.int32)
+        if blocks.size == 0:
+            return
+        if self._size and blocks.min() < self._blocks[self._size - 1]:
+            raise ValueError("History deltas must be ingested in block order.")
+
+        # One int64 key per (block, candidate) keeps the aggregation 1-D
+        width = int(candidate_ids.max()) + 1
+        keys, inverse = np.unique(blocks * width + candidate_ids, return_inverse=True)
+        unique_blocks, unique_candidates = np.divmod(keys, width)
+        summed = np.bincount(inverse.ravel(), weights=deltas, minlength=len(keys))
+
+        n = len(unique_blocks)
+        self._reserve(n)
+        self._blocks[self._size : self._size + n] = unique_blocks
+        self._candidates[self._size : self._size + n] = unique_candidates
+        self._deltas[self._size : self._size + n] = summed
+        self._size += n
+        self.synced_block = max(self.synced_block, int(unique_blocks[-1]))
+
+    def ingest_logs(self, logs, synced_block: Optional[int] = None):
+        """
+        Ingests `VoteCast` event logs, one +1 delta per ballot. Logs at or
+        below the synced block were already ingested and are skipped.
+        """
+        logs = [log for log in logs if log["blockNumber"] > self.synced_block]
+        if logs:
+            self.extend(
+                [log["blockNumber"] for log in logs],
+                [self.candidate_id(log["args"]["candidate"]) for log in logs],
+                np.ones(len(logs), dtype=np.int32),
+            )
+        if synced_block is not None:
+            self.synced_block = max(self.synced_block, synced_block)
+
+    def cumulative(self, block: int) -> np.ndarray:
+        """
+        Vote count per candidate id after `block` has been mined.
+        """
+        end = np.searchsorted(self.blocks, block, side="right")
+        return np.bincount(
+            self._candidates[:end],
+            weights=self._deltas[:end],
+            minlength=len(self.candidate_addresses),
+        ).astype(np.int64)
+
+    def window(self, start_block: int, end_block: int) -> np.ndarray:
+        """
+        Votes per candidate id cast in blocks [start_block, end_block].
+        """
+        start, end = np.searchsorted(self.blocks, [start_block, end_block + 1])
+        return np.bincount(
+            self._candidates[start:end],
+            weights=self._deltas[start:end],
+            minlength=len(self.candidate_addresses),
+        ).astype(np.int64)
+
+    def curve(self, edges) -> np.ndarray:
+        """
+        Cumulative counts at each sorted block in `edges`, one row per edge.
+        Computed with one bincount over the rows between the first and last edge.
+        """
+        edges = np.asarray(edges, dtype=np.int64)
+        num_candidates = len(self.candidate_addresses)
+        if edges.size == 0:
+            return np.zeros((0, num_candidates), dtype=np.int64)
+
+        base = self.cumulative(int(edges[0]))
+        start, end = np.searchsorted(self.blocks, [edges[0] + 1, edges[-1] + 1])
+        buckets = np.searchsorted(edges, self._blocks[start:end], side="left")
+        counts = np.bincount(
+            buckets * num_candidates + self._candidates[start:end],
+            weights=self._deltas[start:end],
+            minlength=len(edges) * num_candidates,
+        )
+        counts = counts.astype(np.int64).reshape(len(edges), num_candidates)
+        return base + np.cumsum(counts, axis=0)
+
+    def history(
+        self,
+        from_block: int,
+        to_block: int,
+        step: int,
+        electorate: Optional[int] = None,
+    ) -> HistoryCurve:
+        """
+        Sampled cumulative counts, per-window votes and turnout over a block range.
+        Samples every `step` blocks back from `to_block`; each window ends at
+        its sampled block and starts after the previous one (the first window
+        starts at `from_block`).
+        """
+        if from_block < 0 or to_block < from_block:
+            raise ValueError(
+                f"Invalid block range: from_block={from_block}, to_block={to_block}."
+            )
+        if step < 1:
+            raise ValueError(f"Invalid step: {step}.")
+        if electorate is not None and electorate < 0:
+            raise ValueError(f"Invalid electorate: {electorate}.")
+
+        # Anchored at to_block so the latest tally is always the last sample
+        edges = np.arange(to_block, from_block - 1, -step, dtype=np.int64)[::-1]
+
+        cumulative = self.curve(edges)
+        before = self.cumulative(from_block - 1)
+        votes = np.diff(cumulative, axis=0, prepend=before[np.newaxis, :])
+
+        turnout = None
+        if electorate:
+            turnout = (cumulative.sum(axis=1) / electorate).tolist()
+
+        return HistoryCurve(
+            candidates=self.candidate_addresses,
+            blocks=edges.tolist(),
+            cumulative={
+                address: cumulative[:, i].tolist()
+                for i, address in enumerate(self.candidate_addresses)
+            },
+            votes={
+                address: votes[:, i].tolist()
+                for i, address in enumerate(self.candidate_addresses)
+            },
+            turnout=turnout,
+        )
+
+    def sample(
+        self,
+        from_block: int,
+        to_block: int,
+        points: int,
+        electorate: Optional[int] = None,
+    ) -> HistoryCurve:
+        """
+        `history` with at most `points` samples, the last one at `to_block`.
+        `points` is capped at MAX_HISTORY_POINTS and `to_block` at the last
+        synced block, so the response size is bounded whatever the caller asks.
+        """
+        to_block = min(to_block, self.synced_block)
+        points = min(max(1, points), MAX_HISTORY_POINTS)
+        span = to_block - from_block + 1
+        step = max(1, -(-span // points))
+        return self.history(from_block, to_block, step, electorate)
@@ -1,33 +1,92 @@
 import json
 import os
+import threading
+from typing import Optional
 from web3 import Web3
 from dotenv import load_dotenv
 
+from core.config.credentials import GanacheManager
+from core.control.allowlist import MerkleAllowlist
+from core.control.history import HistoryCurve, TallyHistory
+
 
 class VoteService:
-    def __init__(self, credentials_path: str):
+    def __init__(self, credentials_path: str, allowlist_path: Optional[str] = None):
         load_dotenv()
         self.w3 = Web3(Web3.HTTPProvider(os.getenv("RPC_URL")))
         manager = GanacheManager(output_file=credentials_path)
-        manager = GanacheManager(output_file=credentials_path)
-        manager = GanacheManager(output_file=credentials_path)
-        self.credentials = manager.extract_credentials()
+        self.credentials = manager.extract_credentials(w3=self.w3)
         self.private_key = self.credentials.private_keys[0]
         self.account = self.w3.eth.account.from_key(self.private_key)
         self.w3.eth.default_account = self.account.address
         self.contract = self._get_contract()
+        self.allowlist = MerkleAllowlist(allowlist_path) if allowlist_path else None
+        self.history = TallyHistory()
+        # Flask serves requests on several threads; syncs and queries take turns
+        self._history_lock = threading.RLock()
 
     def _get_contract(self):
         with open("contract_meta.json", "r") as f:
             meta = json.load(f)
         return self.w3.eth.contract(address=meta["contractAddress"], abi=meta["abi"])
 
+    def _proof_for(self, voter_address):
+        # Open elections (no allowlist configured) send an empty proof
+        if self.allowlist is None:
+            return []
+        if self.allowlist.index_of(voter_address) is None:
+            raise ValueError(
+                f"Account {voter_address} is not on the voter allowlist "
+                f"'{self.allowlist.path}'."
+            )
+        return self.allowlist.proof_for(voter_address)
+
+    def register_allowlist(self):
+        """
+        Publishes the allowlist root on-chain; one transaction regardless of roll size.
+        """
+        if self.allowlist is None:
+            raise ValueError("No voter allowlist configured.")
+        transaction = self.contract.functions.setVoterRoot(
+            self.allowlist.root
+        ).transact({"from": self.w3.eth.default_account})
+        return self.w3.eth.wait_for_transaction_receipt(transaction)
+
     def vote(self, candidate_address):
-        transaction = self.contract.functions.vote(candidate_address).transact(
-            {"from": self.w3.eth.default_account}
-        )
+        voter_address = self.w3.eth.default_account
+        transaction = self.contract.functions.vote(
+            candidate_address, self._proof_for(voter_address)
+        ).transact({"from": voter_address})
         receipt = self.w3.eth.wait_for_transaction_receipt(transaction)
         return receipt
 
     def get_candidate_vote_count(self, candidate_address):
         return self.contract.functions.getCandidateVoteCount(candidate_address).call()
+
+    def sync_history(self):
+        """
+        Pulls VoteCast logs mined since the last sync into the history store.
+        """
+        with self._history_lock:
+            latest = self.w3.eth.block_number
+            if latest <= self.history.synced_block:
+                return
+            logs = self.contract.events.VoteCast.get_logs(
+                from_block=self.history.synced_block + 1, to_block=latest
+            )
+            self.history.ingest_logs(logs, synced_block=latest)
+
+    def get_history(
+        self,
+        from_block: int = 0,
+        to_block: Optional[int] = None,
+        points: int = 100,
+        electorate: Optional[int] = None,
+    ) -> HistoryCurve:
+        if electorate is None and self.allowlist is not None:
+            electorate = self.allowlist.count
+        with self._history_lock:
+            self.sync_history()
+            if to_block is None:
+                to_block = self.history.synced_block
+            return self.history.sample(from_block, to_block, points, electorate)
@@ -2,7 +2,7 @@
 import os
 import json
 from time import sleep
-from typing import List
+from typing import List, Optional
 
 from web3 import Web3
 from web3.exceptions import (
@@ -11,7 +11,7 @@ from web3.exceptions import (
 )
 
 from core.control.compiler import ContractCompiler
-from core.config.credentials import GanacheManager, GanacheCredentials
+from core.config.credentials import GanacheManager, CredentialCache
 
 
 class VotingTestEnvironment:
@@ -31,7 +31,7 @@ class VotingTestEnvironment:
 
         # will be set in start()
         self.manager: GanacheManager | None = None
-        self.creds: GanacheCredentials | None = None
+        self.creds: CredentialCache | None = None
         self.w3: Web3 | None = None
         self.account = None
         self.private_key = None
@@ -43,16 +43,15 @@ class VotingTestEnvironment:
     #  START  (ganache → compile → deploy)
     # ──────────────────────────────────────────────────────────────────
     def start(self):
-        self.manager = GanacheManager(output_file="cred/ganache_output.txt")
-        self.creds = self.manager.extract_credentials()
-
-        # 4) connect to node
+        # 4) connect to node (first, so the credentials can be checked against it)
         self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
         assert self.w3.is_connected(), "Web3 could not connect to Ganache"
 
-        print("\n✅ Available accounts:")
-        for i, addr in enumerate(self.creds.accounts):
-            print(f"({i}) {addr}")
+        self.manager = GanacheManager(output_file="cred/ganache_output.txt")
+        self.creds = self.manager.extract_credentials(w3=self.w3)
+
+        # accounts are decoded lazily from the cache; only report how many exist
+        print(f"\n✅ Available accounts: {len(self.creds)}")
 
         # 2) choose two candidates
         # Ensure we have enough accounts before selecting
@@ -145,11 +144,18 @@ class VotingTestEnvironment:
     # ──────────────────────────────────────────────────────────────────
     #  vote()
     # ──────────────────────────────────────────────────────────────────
-    def vote(self, voter_index: int, candidate_address: str):
+    def vote(
+        self,
+        voter_index: int,
+        candidate_address: str,
+        proof: Optional[List[bytes]] = None,
+    ):
         pk = self.creds.private_keys[voter_index]  # type: ignore
         acct = self.w3.eth.account.from_key(pk)  # type: ignore
 
-        tx = self.contract.functions.vote(candidate_address).build_transaction(
+        tx = self.contract.functions.vote(
+            candidate_address, proof or []
+        ).build_transaction(
             {
                 "from": acct.address,
                 "nonce": self.w3.eth.get_transaction_count(acct.address),  # type: ignore
@@ -162,6 +168,16 @@ class VotingTestEnvironment:
         self.w3.eth.wait_for_transaction_receipt(tx_hash)  # type: ignore
         print(f"✅ {acct.address} voted (tx {tx_hash.hex()})")
 
+    # ──────────────────────────────────────────────────────────────────
+    #  set_voter_root()
+    # ──────────────────────────────────────────────────────────────────
+    def set_voter_root(self, root: bytes):
+        tx_hash = self.contract.functions.setVoterRoot(root).transact(  # type: ignore
+            {"from": self.account.address}  # type: ignore
+        )
+        self.w3.eth.wait_for_transaction_receipt(tx_hash)  # type: ignore
+        print(f"✅ Voter allowlist root set to 0x{root.hex()}")
+
     # ──────────────────────────────────────────────────────────────────
     #  get_vote_count()
     # ──────────────────────────────────────────────────────────────────
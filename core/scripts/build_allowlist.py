@@ -0,0 +1,32 @@
+import argparse
+
+from core.control.allowlist import MerkleAllowlistBuilder
+from core.control.service import VoteService
+
+# Usage: python -m core.scripts.build_allowlist [roll.csv] [output.allowlist]
+#        [--register]  (sent from the owner, account 0; it need not be a voter)
+parser = argparse.ArgumentParser(description="Build a Merkle voter allowlist.")
+parser.add_argument("roll_path", nargs="?", default="cred/voter_roll.csv")
+parser.add_argument("output_path", nargs="?", default="cred/voters.allowlist")
+parser.add_argument(
+    "--register",
+    action="store_true",
+    help="Publish the root with one setVoterRoot transaction from the owner account.",
+)
+parser.add_argument("--credentials", default="cred/ganache_output.txt")
+args = parser.parse_args()
+
+summary = MerkleAllowlistBuilder(
+    roll_path=args.roll_path, output_path=args.output_path
+).build()
+
+if args.register:
+    service = VoteService(
+        credentials_path=args.credentials, allowlist_path=summary.path
+    )
+    receipt = service.register_allowlist()
+    print(f"✅ Voter root registered (tx {receipt['transactionHash'].hex()})")
+else:
+    # Register later with --register, then point the API at the file with
+    # VOTER_ALLOWLIST=<output.allowlist>.
+    print(f"Root to register: {summary.root}")
@@ -13,19 +13,19 @@ candidates = {"Alice": CANDIDATE_ALICE, "Bob": CANDIDATE_BOB}
 
 
 def get_results():
+    # One history query returns the latest tally for every candidate
+    response = requests.get(f"{API_BASE_URL}/results/history", params={"points": 1})
+    if response.status_code != 200:
+        print(f"Error fetching results: {response.status_code}")
+        return []
+    data = response.json()
+    if not isinstance(data, dict) or "cumulative" not in data:
+        print(f"Error: Unexpected response format: {data}")
+        return []
     results = []
-    for name, address in candidates.items():
-        response = requests.get(f"{API_BASE_URL}/results/{address}")
-        if response.status_code == 200:
-            data = response.json()
-            # Ensure the data is in the expected format
-            if isinstance(data, dict) and "candidate" in data and "votes" in data:
-                results.append({"candidate": data["candidate"], "votes": data["votes"]})
-            else:
-                print(f"Error: Unexpected response format for {name}: {data}")
-
-        else:
-            print(f"Error fetching results for {name}: {response.status_code}")
+    for address in candidates.values():
+        counts = data["cumulative"].get(address, [0])
+        results.append({"candidate": address, "votes": counts[-1]})
     return results
 
 
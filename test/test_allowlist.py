@@ -0,0 +1,64 @@
+import pytest
+from core.control.allowlist import MerkleAllowlist, MerkleAllowlistBuilder
+
+ADDRESSES = [f"0x{i:040x}" for i in range(1, 12)]
+
+
+def _write_roll(path, addresses, header=True):
+    lines = ["name,address"] if header else []
+    lines += [
+        f"voter{i},{addr}" if header else addr for i, addr in enumerate(addresses)
+    ]
+    path.write_text("\n".join(lines) + "\n")
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 8, 11])
+def test_every_voter_has_a_valid_proof(tmp_path, count):
+    """
+    Scenario: A roll is streamed into a Merkle allowlist.
+    - Every voter's proof should hash up to the published root.
+    """
+    roll = tmp_path / "roll.csv"
+    _write_roll(roll, ADDRESSES[:count])
+    summary = MerkleAllowlistBuilder(
+        str(roll), str(tmp_path / "voters.allowlist")
+    ).build()
+
+    allowlist = MerkleAllowlist(summary.path)
+    assert allowlist.count == count
+    assert "0x" + allowlist.root.hex() == summary.root
+    for index, address in enumerate(ADDRESSES[:count]):
+        assert allowlist.index_of(address) == index
+        assert allowlist.verify(address, allowlist.proof_for(address))
+    allowlist.close()
+
+
+def test_unknown_voter_is_rejected(tmp_path):
+    """
+    Scenario: An address that is not on the roll asks for a proof.
+    - The lookup should fail and a borrowed proof should not verify.
+    """
+    roll = tmp_path / "roll.csv"
+    _write_roll(roll, ADDRESSES[:5], header=False)
+    summary = MerkleAllowlistBuilder(
+        str(roll), str(tmp_path / "voters.allowlist")
+    ).build()
+
+    allowlist = MerkleAllowlist(summary.path)
+    outsider = ADDRESSES[-1]
+    assert allowlist.index_of(outsider) is None
+    with pytest.raises(KeyError):
+        allowlist.proof_for(outsider)
+    assert not allowlist.verify(outsider, allowlist.proof_for(ADDRESSES[0]))
+    allowlist.close()
+
+
+def test_duplicate_voter_is_rejected(tmp_path):
+    """
+    Scenario: The roll lists the same address twice.
+    - Building the allowlist should fail.
+    """
+    roll = tmp_path / "roll.csv"
+    _write_roll(roll, ADDRESSES[:3] + ADDRESSES[1:2])
+    with pytest.raises(ValueError):
+        MerkleAllowlistBuilder(str(roll), str(tmp_path / "voters.allowlist")).build()
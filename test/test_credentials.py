@@ -0,0 +1,157 @@
+import os
+import shutil
+import struct
+
+import pytest
+from core.config.credentials import CredentialCache, GanacheManager
+
+
+@pytest.fixture
+def output_file(tmp_path):
+    path = tmp_path / "ganache_output.txt"
+    shutil.copy("cred/ganache_output.txt", path)
+    return path
+
+
+def test_extract_credentials_in_order(output_file):
+    """
+    Scenario: Credentials are streamed from a recorded Ganache output.
+    - Accounts and keys should come back in index order.
+    - Key lines must not be mistaken for account addresses.
+    """
+    manager = GanacheManager(output_file=str(output_file), wait_seconds=0)
+    creds = manager.extract_credentials()
+
+    assert len(creds) == 5
+    assert list(creds.accounts) == [
+        "0x4DcB66c994Ceea21C702300dDeb46a37Fdd89d1c",
+        "0x1C947546EdB66A96b51Ab34bf27285cC981f22F4",
+        "0xe06BAB2cC49Ea6D68170337eb761d3BDedbe7590",
+        "0xAd21959Bc8C3b04CF6114485e69B0d0954Aa1f55",
+        "0xcC320d9f7be9c78f1ad3A1F51eEA4c4b550e09f2",
+    ]
+    assert creds.private_keys[0] == (
+        "0x60737c4eca22e6a5c239174935ae86e46d7960b1a752e531687e497f03fd0eb1"
+    )
+    assert creds.private_keys[-1] == (
+        "0xdfba6f2febce0ebd2804d2e3398723db44ddcdff7f216053a21feb82ff933d05"
+    )
+    with pytest.raises(IndexError):
+        creds.private_keys[5]
+    creds.close()
+
+
+def test_cache_is_reused(output_file):
+    """
+    Scenario: A second manager starts after the cache has been written.
+    - It should load the cache even if the raw output is gone.
+    """
+    GanacheManager(output_file=str(output_file), wait_seconds=0).extract_credentials()
+    output_file.unlink()
+
+    manager = GanacheManager(output_file=str(output_file), wait_seconds=0)
+    creds = manager.extract_credentials()
+    assert isinstance(creds, CredentialCache)
+    assert creds.accounts[2] == "0xe06BAB2cC49Ea6D68170337eb761d3BDedbe7590"
+    creds.close()
+
+
+def test_missing_keys_are_rejected(tmp_path):
+    """
+    Scenario: Ganache output stops before the private keys are printed.
+    - Extraction should fail instead of returning partial credentials.
+    """
+    path = tmp_path / "ganache_output.txt"
+    path.write_text(
+        "Available Accounts\n==================\n"
+        "(0) 0x4DcB66c994Ceea21C702300dDeb46a37Fdd89d1c (1000 ETH)\n"
+    )
+    with pytest.raises(ValueError):
+        GanacheManager(output_file=str(path), wait_seconds=0).extract_credentials()
+
+
+def test_rewritten_output_rebuilds_cache(output_file):
+    """
+    Scenario: Ganache restarts and rewrites the output with the same size
+    and timestamp as the cached run.
+    - The cache should be rebuilt instead of returning the old keys.
+    """
+    GanacheManager(output_file=str(output_file), wait_seconds=0).extract_credentials()
+    stat = output_file.stat()
+    content = output_file.read_text()
+    output_file.write_text(
+        content.replace("4DcB66c994Ceea21C702300dDeb46a37Fdd89d1c", "1" * 40).replace(
+            "60737c4eca22e6a5c239174935ae86e46d7960b1a752e531687e497f03fd0eb1",
+            "2" * 64,
+        )
+    )
+    os.utime(output_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    creds = GanacheManager(
+        output_file=str(output_file), wait_seconds=0
+    ).extract_credentials()
+    assert creds.accounts[0] == "0x" + "1" * 40
+    assert creds.private_keys[0] == "0x" + "2" * 64
+    creds.close()
+
+
+def test_failed_extraction_leaves_no_partial_cache(tmp_path):
+    """
+    Scenario: The Ganache output file does not exist.
+    - Extraction should fail without leaving a temporary cache behind.
+    """
+    manager = GanacheManager(
+        output_file=str(tmp_path / "ganache_output.txt"), wait_seconds=0
+    )
+    with pytest.raises(FileNotFoundError):
+        manager.extract_credentials()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("content", [b"", b"GCREDS02", b"NOTACACHE" + bytes(40)])
+def test_corrupt_cache_is_rejected_and_closed(tmp_path, monkeypatch, content):
+    """
+    Scenario: The cache file is empty, truncated or not a cache at all.
+    - Opening it should fail and close the file handle.
+    """
+    path = tmp_path / "ganache_output.creds"
+    path.write_bytes(content)
+    handles = []
+    real_open = open
+
+    def tracking_open(*args, **kwargs):
+        handle = real_open(*args, **kwargs)
+        handles.append(handle)
+        return handle
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    with pytest.raises((ValueError, struct.error)):
+        CredentialCache(str(path))
+    assert handles and all(handle.closed for handle in handles)
+
+
+class _FakeNode:
+    def __init__(self, accounts, connected=True):
+        self.eth = type("Eth", (), {"accounts": accounts})()
+        self._connected = connected
+
+    def is_connected(self):
+        return self._connected
+
+
+def test_pinned_cache_is_checked_against_node(output_file):
+    """
+    Scenario: Only a cache from an earlier Ganache run is left on disk.
+    - A node with other accounts should make extraction fail.
+    - A matching or unreachable node should keep the pinned cache.
+    """
+    GanacheManager(output_file=str(output_file), wait_seconds=0).extract_credentials()
+    output_file.unlink()
+    manager = GanacheManager(output_file=str(output_file), wait_seconds=0)
+
+    with pytest.raises(ValueError):
+        manager.extract_credentials(w3=_FakeNode(["0x" + "1" * 40]))
+
+    node = _FakeNode(["0x4dcb66c994ceea21c702300ddeb46a37fdd89d1c"])
+    manager.extract_credentials(w3=node).close()
+    manager.extract_credentials(w3=_FakeNode([], connected=False)).close()
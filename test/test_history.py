@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from core.control.history import TallyHistory
+
+ALICE = "0x1C947546EdB66A96b51Ab34bf27285cC981f22F4"
+BOB = "0xe06BAB2cC49Ea6D68170337eb761d3BDedbe7590"
+
+
+def _log(block, candidate):
+    return {"blockNumber": block, "args": {"candidate": candidate}}
+
+
+@pytest.fixture
+def history():
+    store = TallyHistory(initial_capacity=2)
+    store.ingest_logs(
+        [_log(3, ALICE), _log(3, ALICE), _log(5, BOB), _log(8, ALICE), _log(9, BOB)],
+        synced_block=12,
+    )
+    return store
+
+
+def test_ingest_aggregates_per_block(history):
+    """
+    Scenario: Several ballots land in the same block.
+    - They should be stored as a single (block, candidate, delta) row.
+    """
+    assert len(history) == 4
+    assert history.blocks.tolist() == [3, 5, 8, 9]
+    assert history.deltas.tolist() == [2, 1, 1, 1]
+    assert history.synced_block == 12
+
+
+def test_range_queries(history):
+    """
+    Scenario: Cumulative counts and block windows are queried.
+    - Counts should only include ballots mined in the requested blocks.
+    """
+    alice, bob = history.candidate_ids[ALICE], history.candidate_ids[BOB]
+    assert history.cumulative(2).tolist() == [0, 0]
+    assert history.cumulative(5)[[alice, bob]].tolist() == [2, 1]
+    assert history.window(4, 8)[[alice, bob]].tolist() == [1, 1]
+    assert history.curve([3, 6, 12])[:, alice].tolist() == [2, 2, 3]
+
+
+def test_history_curve_and_turnout(history):
+    """
+    Scenario: The audit endpoint samples the range every 4 blocks.
+    - Per-window votes should add up to the cumulative counts.
+    - Turnout should be total ballots over the electorate.
+    """
+    curve = history.history(0, 12, 4, electorate=10)
+    assert curve.blocks == [0, 4, 8, 12]
+    assert curve.cumulative[ALICE] == [0, 2, 3, 3]
+    assert curve.votes[BOB] == [0, 0, 1, 1]
+    assert curve.turnout == [0.0, 0.2, 0.4, 0.5]
+
+
+def test_out_of_order_ingest_is_rejected(history):
+    """
+    Scenario: A batch older than the stored history is ingested.
+    - The store should refuse it to keep the columns sorted by block.
+    """
+    with pytest.raises(ValueError):
+        history.extend(np.array([4]), np.array([0]), np.array([1]))
+
+
+@pytest.mark.parametrize("points, expected", [(1, 1), (2, 2), (100, 76), (500, 151)])
+def test_sample_respects_points(points, expected):
+    """
+    Scenario: The endpoint asks for at most `points` samples of a 151-block span.
+    - The curve should hold at most `points` samples, ending at the last block.
+    """
+    store = TallyHistory()
+    store.ingest_logs([_log(10, ALICE), _log(140, BOB)], synced_block=150)
+    curve = store.sample(0, 150, points)
+    assert len(curve.blocks) == expected
+    assert len(curve.blocks) <= points
+    assert curve.blocks[-1] == 150
+    assert curve.cumulative[ALICE][-1] == 1
+
+
+def test_sample_is_bounded(history):
+    """
+    Scenario: A caller asks for a huge block range and sample count.
+    - `to_block` should stop at the synced block and samples at the cap.
+    """
+    curve = history.sample(0, 1_000_000_000, 1_000_000_000)
+    assert curve.blocks[-1] == history.synced_block
+    assert len(curve.blocks) == history.synced_block + 1
+
+
+@pytest.mark.parametrize(
+    "from_block, to_block, electorate", [(10, 5, None), (-1, 5, None), (0, 5, -1)]
+)
+def test_invalid_queries_are_rejected(history, from_block, to_block, electorate):
+    """
+    Scenario: An inverted range, a negative block or a negative electorate.
+    - The query should be rejected instead of returning negative counts.
+    """
+    with pytest.raises(ValueError):
+        history.sample(from_block, to_block, 10, electorate=electorate)
+
+
+def test_already_synced_logs_are_skipped(history):
+    """
+    Scenario: Logs from an already synced range are ingested again.
+    - They should not be counted twice.
+    """
+    history.ingest_logs([_log(9, BOB), _log(13, BOB)])
+    assert history.cumulative(12)[history.candidate_ids[BOB]] == 2
+    assert history.cumulative(13)[history.candidate_ids[BOB]] == 3
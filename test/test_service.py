@@ -0,0 +1,79 @@
+import threading
+import time
+
+from core.control.service import VoteService
+from core.control.history import TallyHistory
+
+ALICE = "0x1C947546EdB66A96b51Ab34bf27285cC981f22F4"
+BOB = "0xe06BAB2cC49Ea6D68170337eb761d3BDedbe7590"
+
+
+class _FakeEth:
+    block_number = 7
+
+
+class _FakeW3:
+    eth = _FakeEth()
+
+
+class _FakeVoteCast:
+    """
+    Event source that returns logs in the requested range, slowly enough
+    for two unguarded syncs to overlap.
+    """
+
+    def __init__(self, logs):
+        self.logs = logs
+        self.calls = 0
+
+    def get_logs(self, from_block, to_block):
+        self.calls += 1
+        time.sleep(0.05)
+        return [
+            log for log in self.logs if from_block <= log["blockNumber"] <= to_block
+        ]
+
+
+class _FakeEvents:
+    def __init__(self, vote_cast):
+        self.VoteCast = vote_cast
+
+
+class _FakeContract:
+    def __init__(self, vote_cast):
+        self.events = _FakeEvents(vote_cast)
+
+
+def _service(logs):
+    # Skip __init__: it needs a node, credentials and contract metadata
+    service = VoteService.__new__(VoteService)
+    service.w3 = _FakeW3()
+    service.contract = _FakeContract(_FakeVoteCast(logs))
+    service.allowlist = None
+    service.history = TallyHistory()
+    service._history_lock = threading.RLock()
+    return service
+
+
+def test_concurrent_syncs_ingest_once():
+    """
+    Scenario: Two /results/history requests sync the history at the same time.
+    - Every VoteCast log should be counted exactly once.
+    """
+    service = _service(
+        [
+            {"blockNumber": 3, "args": {"candidate": BOB}},
+            {"blockNumber": 5, "args": {"candidate": ALICE}},
+        ]
+    )
+    threads = [threading.Thread(target=service.sync_history) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert service.contract.events.VoteCast.calls == 1
+    alice = service.history.candidate_ids[ALICE]
+    assert service.history.cumulative(5)[alice] == 1
+    assert service.history.cumulative(7).sum() == 2
+    assert service.history.synced_block == 7
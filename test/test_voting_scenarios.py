@@ -1,4 +1,5 @@
 import pytest
+from core.control.allowlist import MerkleAllowlist, MerkleAllowlistBuilder
 from core.control.voting import VotingTestEnvironment
 
 
@@ -125,3 +126,38 @@ def test_owner_only_functions(env):
         env.contract.functions.initializeCandidates(
             env.candidate_addresses, env.candidate_names
         ).transact({"from": env.w3.eth.accounts[1]})
+
+
+def test_allowlisted_voting(env, tmp_path):
+    """
+    Scenario: The owner restricts voting to a Merkle allowlist.
+    - Voter 7 is on the roll and votes with a proof; the vote counts.
+    - Voter 8 is not on the roll; the vote is reverted.
+    """
+    roll = tmp_path / "roll.csv"
+    roll.write_text(
+        "address\n" + env.w3.eth.accounts[7] + "\n" + env.w3.eth.accounts[9] + "\n"
+    )
+    summary = MerkleAllowlistBuilder(
+        str(roll), str(tmp_path / "voters.allowlist")
+    ).build()
+    allowlist = MerkleAllowlist(summary.path)
+    env.set_voter_root(allowlist.root)
+    try:
+        alice_address = env.candidate_addresses[0]
+        before = env.get_vote_count(alice_address)
+
+        env.vote(
+            voter_index=7,
+            candidate_address=alice_address,
+            proof=allowlist.proof_for(env.w3.eth.accounts[7]),
+        )
+        env.vote(voter_index=8, candidate_address=alice_address)
+
+        assert env.get_vote_count(alice_address) == before + 1
+        voter_info = env.contract.functions.voters(env.w3.eth.accounts[8]).call()
+        assert voter_info[0] is False
+    finally:
+        # reopen voting so tests that run after this one vote without proofs
+        env.set_voter_root(bytes(32))
+        allowlist.close()